@@ -100,13 +100,18 @@ class GunicornMonitor(LoggingMixin):
         self._num_workers_running = 0
         self._num_ready_workers_running = 0
         self._last_refresh_time = time.monotonic() if worker_refresh_interval > 0 else None
+        self._plugin_hash_cache: dict[str, tuple[int, int, str]] = {}
         self._last_plugin_state = self._generate_plugin_state() if reload_on_plugin_change else None
         self._restart_on_next_plugin_check = False
 
-    def _generate_plugin_state(self) -> dict[str, float]:
+    def _generate_plugin_state(self) -> dict[str, str]:
         """
-        Generate dict of filenames and last modification time of all files in settings.PLUGINS_FOLDER
+        Generate dict of filenames and content hashes of all files in settings.PLUGINS_FOLDER
         directory.
+
+        A file is only re-hashed when its size or modification time changed since the previous call.
+        As a tradeoff, a rewrite that keeps both the same (e.g. same-size edit within the filesystem's
+        mtime resolution, or a tool restoring mtimes like ``touch -r`` or ``rsync -t``) is not detected.
         """
         if not settings.PLUGINS_FOLDER:
             return {}
@@ -114,17 +119,38 @@ class GunicornMonitor(LoggingMixin):
         all_filenames: list[str] = []
         for (root, _, filenames) in os.walk(settings.PLUGINS_FOLDER):
             all_filenames.extend(os.path.join(root, f) for f in filenames)
-        plugin_state = {f: self._get_file_hash(f) for f in sorted(all_filenames)}
+        plugin_state = {f: self._get_cached_file_hash(f) for f in sorted(all_filenames)}
+        # Forget files that were removed from the plugins folder
+        for fname in self._plugin_hash_cache.keys() - plugin_state.keys():
+            del self._plugin_hash_cache[fname]
         return plugin_state
 
+    def _get_cached_file_hash(self, fname: str) -> str:
+        """Return hash of the file, reusing the previous one if the size and modification time match"""
+        stat = os.stat(fname)
+        cached = self._plugin_hash_cache.get(fname)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        file_hash = self._get_file_hash(fname)
+        self._plugin_hash_cache[fname] = (stat.st_size, stat.st_mtime_ns, file_hash)
+        return file_hash
+
     @staticmethod
     def _get_file_hash(fname: str):
-        """Calculate MD5 hash for file"""
-        hash_md5 = hashlib.md5()
-        with open(fname, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        """Calculate BLAKE2b hash for file"""
+        # Only used to detect changes; BLAKE2b is faster than MD5 on 64-bit platforms
+        file_hash = hashlib.blake2b(digest_size=16)
+        # Read into a single reused buffer rather than allocating a new bytes object per chunk.
+        # mmap is avoided on purpose: a file truncated while being hashed would raise SIGBUS.
+        buffer = bytearray(64 * 1024)
+        view = memoryview(buffer)
+        with open(fname, "rb", buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                file_hash.update(view[:size])
+        return file_hash.hexdigest()
 
     def _get_num_ready_workers_running(self) -> int:
         """Returns number of ready Gunicorn workers by looking for READY_PREFIX in process name"""